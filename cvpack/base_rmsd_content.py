@@ -7,6 +7,10 @@
 
 """
 
+import functools
+import io
+import re
+import sys
 import typing as t
 from importlib import resources
 
@@ -18,6 +22,43 @@ from .collective_variable import CollectiveVariable
 from .rmsd import RMSD
 from .units import ScalarQuantity, value_in_md_units
 
+# Default step function, expanded with x^4 as a common subexpression when used
+DEFAULT_STEP_FUNCTION = "(1+x^4)/(1+x^4+x^8)"
+
+# Matches the variable `x` as a whole word, leaving names like `exp` untouched
+STEP_VARIABLE = re.compile(r"(?<![A-Za-z_0-9])x(?![A-Za-z_0-9])")
+
+# Atoms that represent each residue, in order (glycine uses HA2 in place of CB)
+RESIDUE_ATOMS = ("N", "CA", "CB", "C", "O")
+GLYCINE_ATOMS = ("N", "CA", "HA2", "C", "O")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_positions(filename: str) -> t.Tuple[openmm.Vec3, ...]:
+    text = resources.files("cvpack").joinpath("data").joinpath(filename).read_text()
+    positions = 0.1 * np.loadtxt(io.StringIO(text), delimiter=",", dtype=np.float64)
+    return tuple(openmm.Vec3(*position) for position in positions)
+
+
+def _lazy_positions(
+    module_name: str, files: t.Dict[str, str]
+) -> t.Tuple[t.Callable[[str], t.Any], t.Callable[[], t.List[str]]]:
+    """
+    Create the module-level ``__getattr__`` and ``__dir__`` functions (PEP 562) that
+    expose ideal positions as module attributes, each loaded on first access.
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> t.Any:
+        if name in files:
+            return _load_positions(files[name])
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__() -> t.List[str]:
+        return sorted(set(vars(module)) | set(files))
+
+    return __getattr__, __dir__
+
 
 class BaseRMSDContent(openmm.CustomCVForce, CollectiveVariable):
     """
@@ -27,11 +68,11 @@ class BaseRMSDContent(openmm.CustomCVForce, CollectiveVariable):
     def __init__(
         self,
         residue_blocks: t.List[int],
-        ideal_positions: t.List[openmm.Vec3],
+        ideal_positions: t.Sequence[openmm.Vec3],
         residues: t.List[mmapp.topology.Residue],
         numAtoms: int,
         thresholdRMSD: ScalarQuantity,
-        stepFunction: str = "(1+x^4)/(1+x^4+x^8)",
+        stepFunction: str = DEFAULT_STEP_FUNCTION,
         normalize: bool = False,
     ):
         num_residue_blocks = self._num_residue_blocks = len(residue_blocks)
@@ -40,66 +81,70 @@ class BaseRMSDContent(openmm.CustomCVForce, CollectiveVariable):
                 f"{len(residues)} residues yield {num_residue_blocks} blocks, "
                 "which is not between 1 and 1024"
             )
-        residue_atoms = list(map(self._getAtomList, residues))
+        residue_atoms = self._getAtomLists(residues)
         block_atoms = [
-            sum([residue_atoms[index] for index in block], [])
-            for block in residue_blocks
+            residue_atoms[block].ravel().tolist() for block in residue_blocks
         ]
 
+        threshold = value_in_md_units(thresholdRMSD)
+
         def get_expression(start):
-            summands = []
-            definitions = []
-            for i in range(start, min(start + 32, num_residue_blocks)):
-                summands.append(stepFunction.replace("x", f"x{i}"))
-                definitions.append(f"x{i}=rmsd{i}/{value_in_md_units(thresholdRMSD)}")
+            indices = range(start, min(start + 32, num_residue_blocks))
+            if stepFunction == DEFAULT_STEP_FUNCTION:
+                summands = [f"(1+u{i})/(1+u{i}*(1+u{i}))" for i in indices]
+                definitions = [f"u{i}=x{i}^4" for i in indices]
+            else:
+                summands = [STEP_VARIABLE.sub(f"x{i}", stepFunction) for i in indices]
+                definitions = []
+            definitions += [f"x{i}=rmsd{i}/{threshold}" for i in indices]
             summation = "+".join(summands)
             if normalize:
                 summation = f"({summation})/{num_residue_blocks}"
             return ";".join([summation] + definitions)
 
-        if num_residue_blocks <= 32:
-            expression = get_expression(0)
-            force = self
+        num_chunks = (num_residue_blocks + 31) // 32
+        if num_chunks == 1:
+            super().__init__(get_expression(0))
+            chunks = [self]
         else:
-            expression = "+".join(
-                f"chunk{i}" for i in range((num_residue_blocks + 31) // 32)
-            )
-        super().__init__(expression)
-        for index in range(num_residue_blocks):
-            if num_residue_blocks > 32 and index % 32 == 0:
-                force = openmm.CustomCVForce(get_expression(index))
-                self.addCollectiveVariable(f"chunk{index//32}", force)
-            force.addCollectiveVariable(
+            super().__init__("+".join(f"chunk{i}" for i in range(num_chunks)))
+            chunks = [
+                openmm.CustomCVForce(get_expression(32 * i)) for i in range(num_chunks)
+            ]
+        for index, atoms in enumerate(block_atoms):
+            chunks[index // 32].addCollectiveVariable(
                 f"rmsd{index}",
-                RMSD(
-                    dict(zip(block_atoms[index], ideal_positions)),
-                    block_atoms[index],
-                    numAtoms,
-                ),
+                RMSD(dict(zip(atoms, ideal_positions)), atoms, numAtoms),
             )
+        if num_chunks > 1:
+            for index, chunk in enumerate(chunks):
+                self.addCollectiveVariable(f"chunk{index}", chunk)
 
     @classmethod
-    def _loadPositions(cls, filename: str) -> t.List[openmm.Vec3]:
-        positions = 0.1 * np.loadtxt(
-            str(resources.files("cvpack").joinpath("data").joinpath(filename)),
-            delimiter=",",
-        )
-        return [openmm.Vec3(*position) for position in positions]
+    def _loadPositions(cls, filename: str) -> t.Tuple[openmm.Vec3, ...]:
+        return _load_positions(filename)
 
     @staticmethod
-    def _getAtomList(residue: mmapp.topology.Residue) -> t.List[int]:
-        residue_atoms = {atom.name: atom.index for atom in residue.atoms()}
-        if residue.name == "GLY":
-            residue_atoms["CB"] = residue_atoms["HA2"]
-        atom_list = []
-        for atom in ("N", "CA", "CB", "C", "O"):
-            try:
-                atom_list.append(residue_atoms[atom])
-            except KeyError as error:
-                raise ValueError(
-                    f"Atom {atom} not found in residue {residue.name}{residue.id}"
-                ) from error
-        return atom_list
+    def _getAtomLists(residues: t.Sequence[mmapp.topology.Residue]) -> np.ndarray:
+        atoms = [list(residue.atoms()) for residue in residues]
+        names = np.array([atom.name for group in atoms for atom in group], dtype=str)
+        indices = np.array([atom.index for group in atoms for atom in group], dtype=int)
+        counts = list(map(len, atoms))
+        rows = np.repeat(np.arange(len(residues)), counts)
+        is_glycine = np.repeat([residue.name == "GLY" for residue in residues], counts)
+        atom_lists = np.full((len(residues), len(RESIDUE_ATOMS)), -1)
+        for slot, pair in enumerate(zip(RESIDUE_ATOMS, GLYCINE_ATOMS)):
+            match = names == np.where(is_glycine, pair[1], pair[0])
+            atom_lists[rows[match], slot] = indices[match]
+        missing = np.argwhere(atom_lists == -1)
+        if missing.size:
+            row, slot = missing[0]
+            residue = residues[row]
+            names = GLYCINE_ATOMS if residue.name == "GLY" else RESIDUE_ATOMS
+            raise ValueError(
+                f"Atom {names[slot]} not found in residue {residue.name}{residue.id}"
+            )
+        return atom_lists
 
     def getNumResidueBlocks(self) -> int:
         """
@@ -29,6 +29,7 @@ class CollectiveVariable(openmm.Force, Serializable):
     _mass_unit: Unit = Unit("dalton")
     _args: t.Dict[str, t.Any] = {}
     _periodic_bounds: t.Optional[Quantity] = None
+    _arguments: t.Tuple[OrderedDict, OrderedDict]
 
     def __getstate__(self) -> t.Dict[str, t.Any]:
         return self._args
@@ -125,13 +126,16 @@ class CollectiveVariable(openmm.Force, Serializable):
         >>> print(*defaults.items())
         ('pbc', False) ('weighByMass', False) ('name', 'radius_of_gyration')
         """
-        arguments = OrderedDict()
-        defaults = OrderedDict()
-        for name, parameter in inspect.signature(cls).parameters.items():
-            arguments[name] = parameter.annotation
-            if parameter.default is not inspect.Parameter.empty:
-                defaults[name] = parameter.default
-        return arguments, defaults
+        if "_arguments" not in cls.__dict__:
+            arguments = OrderedDict()
+            defaults = OrderedDict()
+            for name, parameter in inspect.signature(cls).parameters.items():
+                arguments[name] = parameter.annotation
+                if parameter.default is not inspect.Parameter.empty:
+                    defaults[name] = parameter.default
+            cls._arguments = (arguments, defaults)
+        arguments, defaults = cls._arguments
+        return arguments.copy(), defaults.copy()
 
     def _setUnusedForceGroup(self, system: openmm.System) -> None:
         """
@@ -12,12 +12,11 @@ import typing as t
 from openmm import app as mmapp
 from openmm import unit as mmunit
 
-from .base_rmsd_content import BaseRMSDContent
+from .base_rmsd_content import DEFAULT_STEP_FUNCTION, BaseRMSDContent, _lazy_positions
 from .units import ScalarQuantity
 
-# pylint: disable=protected-access
-ALPHA_POSITIONS = BaseRMSDContent._loadPositions("ideal_alpha_helix.csv")
-# pylint: enable=protected-access
+POSITION_FILES = {"ALPHA_POSITIONS": "ideal_alpha_helix.csv"}
+__getattr__, __dir__ = _lazy_positions(__name__, POSITION_FILES)
 
 
 class HelixRMSDContent(BaseRMSDContent):
@@ -132,7 +131,7 @@ class HelixRMSDContent(BaseRMSDContent):
         residues: t.Sequence[mmapp.topology.Residue],
         numAtoms: int,
         thresholdRMSD: ScalarQuantity = 0.08 * mmunit.nanometers,
-        stepFunction: str = "(1+x^4)/(1+x^4+x^8)",
+        stepFunction: str = DEFAULT_STEP_FUNCTION,
         normalize: bool = False,
         name: str = "helix_rmsd_content",
     ) -> None:
@@ -142,7 +141,7 @@ class HelixRMSDContent(BaseRMSDContent):
 
         super().__init__(
             residue_blocks,
-            ALPHA_POSITIONS,
+            self._loadPositions(POSITION_FILES["ALPHA_POSITIONS"]),
             residues,
             numAtoms,
             thresholdRMSD,
@@ -13,13 +13,14 @@ import numpy as np
 from openmm import app as mmapp
 from openmm import unit as mmunit
 
-from .base_rmsd_content import BaseRMSDContent
+from .base_rmsd_content import DEFAULT_STEP_FUNCTION, BaseRMSDContent, _lazy_positions
 from .units import ScalarQuantity
 
-# pylint: disable=protected-access
-PARABETA_POSITIONS = BaseRMSDContent._loadPositions("ideal_parallel_beta_sheet.csv")
-ANTIBETA_POSITIONS = BaseRMSDContent._loadPositions("ideal_antiparallel_beta_sheet.csv")
-# pylint: enable=protected-access
+POSITION_FILES = {
+    "PARABETA_POSITIONS": "ideal_parallel_beta_sheet.csv",
+    "ANTIBETA_POSITIONS": "ideal_antiparallel_beta_sheet.csv",
+}
+__getattr__, __dir__ = _lazy_positions(__name__, POSITION_FILES)
 
 
 class SheetRMSDContent(BaseRMSDContent):
@@ -183,34 +184,38 @@ class SheetRMSDContent(BaseRMSDContent):
         parallel: bool = False,
         blockSizes: t.Optional[t.Sequence[int]] = None,
         thresholdRMSD: ScalarQuantity = 0.08 * mmunit.nanometers,
-        stepFunction: str = "(1+x^4)/(1+x^4+x^8)",
+        stepFunction: str = DEFAULT_STEP_FUNCTION,
         normalize: bool = False,
         name: str = "sheet_rmsd_content",
     ) -> None:
         if blockSizes is None:
             min_distance = 6 if parallel else 5
-            residue_groups = [
-                [i, i + 1, i + 2, j, j + 1, j + 2]
-                for i in range(len(residues) - 2 - min_distance)
-                for j in range(i + min_distance, len(residues) - 2)
-            ]
+            first, second = np.triu_indices(max(len(residues) - 2, 0), min_distance)
         elif sum(blockSizes) == len(residues):
-            bounds = np.insert(np.cumsum(blockSizes), 0, 0)
-            residue_groups = [
-                [i, i + 1, i + 2, j, j + 1, j + 2]
-                for k in range(len(blockSizes) - 1)
-                for i in range(bounds[k], bounds[k + 1] - 2)
-                for j in range(bounds[k + 1], bounds[k + 2] - 2)
-            ]
+            bounds = np.zeros(len(blockSizes) + 1, dtype=int)
+            np.cumsum(blockSizes, out=bounds[1:])
+            pairs = [np.empty((2, 0), dtype=int)]
+            for k in range(len(blockSizes) - 1):
+                grid = np.meshgrid(
+                    np.arange(bounds[k], bounds[k + 1] - 2),
+                    np.arange(bounds[k + 1], bounds[k + 2] - 2),
+                    indexing="ij",
+                )
+                pairs.append(np.stack([axis.ravel() for axis in grid]))
+            first, second = np.hstack(pairs)
         else:
             raise ValueError(
                 f"The sum of block sizes ({sum(blockSizes)}) and the "
                 f"number of residues ({len(residues)}) must be equal."
             )
+        residue_groups = np.stack(
+            [first, first + 1, first + 2, second, second + 1, second + 2], axis=1
+        ).tolist()
 
+        positions = "PARABETA_POSITIONS" if parallel else "ANTIBETA_POSITIONS"
         super().__init__(
             residue_groups,
-            PARABETA_POSITIONS if parallel else ANTIBETA_POSITIONS,
+            self._loadPositions(POSITION_FILES[positions]),
             residues,
             numAtoms,
             thresholdRMSD,
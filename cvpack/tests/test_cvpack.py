@@ -6,6 +6,7 @@ import copy
 import inspect
 import io
 import itertools as it
+import math
 import os
 import sys
 import tempfile
@@ -25,6 +26,72 @@ from cvpack import serialization
 from cvpack.units import value_in_md_units
 
 
+def create_reference_context(
+    model: testsystems.TestSystem,
+) -> t.Tuple[testsystems.TestSystem, openmm.Context]:
+    """
+    Create a Reference-platform context for a test system.
+
+    """
+    context = openmm.Context(
+        model.system,
+        openmm.VerletIntegrator(0),
+        openmm.Platform.getPlatformByName("Reference"),
+    )
+    context.setPositions(model.positions)
+    return model, context
+
+
+def restore_after_test(
+    model: testsystems.TestSystem, context: openmm.Context
+) -> t.Generator[t.Tuple[testsystems.TestSystem, openmm.Context], None, None]:
+    """
+    Lend a shared context to a test and remove the forces added by it afterwards.
+
+    """
+    num_forces = model.system.getNumForces()
+    yield model, context
+    for index in reversed(range(num_forces, model.system.getNumForces())):
+        model.system.removeForce(index)
+    context.reinitialize(preserveState=True)
+
+
+@pytest.fixture(scope="module", name="sharedAlaContext")
+def fixture_shared_ala_context():
+    """
+    Alanine dipeptide model and context shared by all tests in this module.
+
+    """
+    return create_reference_context(testsystems.AlanineDipeptideVacuum())
+
+
+@pytest.fixture(scope="module", name="sharedLysozymeContext")
+def fixture_shared_lysozyme_context():
+    """
+    Lysozyme model and context shared by all tests in this module.
+
+    """
+    return create_reference_context(testsystems.LysozymeImplicit())
+
+
+@pytest.fixture(name="alaContext")
+def fixture_ala_context(sharedAlaContext):
+    """
+    Shared alanine dipeptide model and context, restored after each test.
+
+    """
+    yield from restore_after_test(*sharedAlaContext)
+
+
+@pytest.fixture(name="lysozymeContext")
+def fixture_lysozyme_context(sharedLysozymeContext):
+    """
+    Shared lysozyme model and context, restored after each test.
+
+    """
+    yield from restore_after_test(*sharedLysozymeContext)
+
+
 def test_cvpack_imported():
     """
     Sample test, will always pass so long as import statement worked.
@@ -68,6 +135,13 @@ def test_argument_inspection():
     assert args["third"] is str
     assert defaults["third"] == "3"
 
+    # Cached introspection must be per class and immune to changes in the results
+    # pylint: disable=protected-access
+    args.pop("first")
+    assert "first" in Test._getArguments()[0]
+    assert "first" not in cvpack.RadiusOfGyration._getArguments()[0]
+    # pylint: enable=protected-access
+
 
 def perform_common_tests(
     collectiveVariable: cvpack.CollectiveVariable,
@@ -123,38 +197,33 @@ def test_cv_is_in_context():
     assert str(excinfo.value) == "This force is not present in the given context."
 
 
-def test_distance():
+def test_distance(alaContext):
     """
     Test whether a distance is computed correctly.
 
     """
-    model = testsystems.AlanineDipeptideVacuum()
+    model, context = alaContext
     atom1, atom2 = 0, 5
     distance = cvpack.Distance(atom1, atom2)
     distance.addToSystem(model.system)
-    integrator = openmm.CustomIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     value1 = distance.getValue(context).value_in_unit(distance.getUnit())
-    value2 = np.sqrt(np.sum(((model.positions[atom1] - model.positions[atom2]) ** 2)))
+    positions = model.positions.value_in_unit(unit.nanometers)
+    value2 = np.linalg.norm(positions[atom1] - positions[atom2])
     assert value1 == pytest.approx(value2)
     perform_common_tests(distance, context)
 
 
-def test_angle():
+def test_angle(alaContext):
     """
     Test whether an angle is computed correctly.
 
     """
-    model = testsystems.AlanineDipeptideVacuum()
+    model, context = alaContext
     atoms = [0, 5, 10]
     angle = cvpack.Angle(*atoms)
     angle.addToSystem(model.system)
-    integrator = openmm.CustomIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     value1 = angle.getValue(context).value_in_unit(angle.getUnit())
     r21 = model.positions[atoms[0]] - model.positions[atoms[1]]
     r23 = model.positions[atoms[2]] - model.positions[atoms[1]]
@@ -163,19 +232,16 @@ def test_angle():
     perform_common_tests(angle, context)
 
 
-def test_torsion():
+def test_torsion(alaContext):
     """
     Test whether a torsion angle is computed correctly.
 
     """
-    model = testsystems.AlanineDipeptideVacuum()
+    model, context = alaContext
     atoms = [0, 5, 10, 15]
     torsion = cvpack.Torsion(*atoms)
     torsion.addToSystem(model.system)
-    integrator = openmm.CustomIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     value1 = torsion.getValue(context).value_in_unit(torsion.getUnit())
     r21 = model.positions[atoms[0]] - model.positions[atoms[1]]
     u23 = model.positions[atoms[2]] - model.positions[atoms[1]]
@@ -188,12 +254,12 @@ def test_torsion():
     perform_common_tests(torsion, context)
 
 
-def test_radius_of_gyration():
+def test_radius_of_gyration(alaContext):
     """
     Test whether a radius of gyration is computed correctly.
 
     """
-    model = testsystems.AlanineDipeptideVacuum()
+    model, context = alaContext
     masses = np.array(
         [value_in_md_units(atom.element.mass) for atom in model.topology.atoms()]
     )
@@ -201,16 +267,15 @@ def test_radius_of_gyration():
     centroid = positions.mean(axis=0)
     center_of_mass = np.einsum("i,ij->j", masses, positions) / np.sum(masses)
     num_atoms = model.system.getNumParticles()
-    rgsq = np.sum((positions - centroid) ** 2) / num_atoms
+    deltas = positions - centroid
+    rgsq = np.einsum("ij,ij->", deltas, deltas) / num_atoms
     rg_cv = cvpack.RadiusOfGyration(range(num_atoms))
-    weighted_rgsq = np.sum((positions - center_of_mass) ** 2) / num_atoms
+    deltas = positions - center_of_mass
+    weighted_rgsq = np.einsum("ij,ij->", deltas, deltas) / num_atoms
     weighted_rg_cv = cvpack.RadiusOfGyration(range(num_atoms), weighByMass=True)
     rg_cv.addToSystem(model.system)
     weighted_rg_cv.addToSystem(model.system)
-    integrator = openmm.CustomIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     rgval = rg_cv.getValue(context).value_in_unit(unit.nanometers)
     assert rgval**2 == pytest.approx(rgsq)
     weighted_rgval = weighted_rg_cv.getValue(context).value_in_unit(unit.nanometers)
@@ -218,12 +283,12 @@ def test_radius_of_gyration():
     perform_common_tests(rg_cv, context)
 
 
-def test_radius_of_gyration_squared():
+def test_radius_of_gyration_squared(alaContext):
     """
     Test whether a squared radius of gyration is computed correctly.
 
     """
-    model = testsystems.AlanineDipeptideVacuum()
+    model, context = alaContext
     masses = np.array(
         [value_in_md_units(atom.element.mass) for atom in model.topology.atoms()]
     )
@@ -231,16 +296,15 @@ def test_radius_of_gyration_squared():
     centroid = positions.mean(axis=0)
     center_of_mass = np.einsum("i,ij->j", masses, positions) / np.sum(masses)
     num_atoms = model.system.getNumParticles()
-    rgsq = np.sum((positions - centroid) ** 2) / num_atoms
+    deltas = positions - centroid
+    rgsq = np.einsum("ij,ij->", deltas, deltas) / num_atoms
     rg_sq = cvpack.RadiusOfGyrationSq(range(num_atoms))
-    weighted_rgsq = np.sum((positions - center_of_mass) ** 2) / num_atoms
+    deltas = positions - center_of_mass
+    weighted_rgsq = np.einsum("ij,ij->", deltas, deltas) / num_atoms
     weighted_rg_sq = cvpack.RadiusOfGyrationSq(range(num_atoms), weighByMass=True)
     rg_sq.addToSystem(model.system)
     weighted_rg_sq.addToSystem(model.system)
-    integrator = openmm.CustomIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     rg_sq_value = value_in_md_units(rg_sq.getValue(context))
     assert rg_sq_value == pytest.approx(rgsq)
     weighted_rg_sq_value = value_in_md_units(weighted_rg_sq.getValue(context))
@@ -248,13 +312,13 @@ def test_radius_of_gyration_squared():
     perform_common_tests(rg_sq, context)
 
 
-def test_number_of_contacts():
+def test_number_of_contacts(alaContext):
     """
     Test whether a number of contacts is computed correctly.
 
     """
-    model = testsystems.AlanineDipeptideVacuum()
-    pos = model.positions
+    model, context = alaContext
+    pos = model.positions.value_in_unit(unit.nanometers)
     group1 = [
         a.index for a in model.topology.atoms() if a.element == app.element.carbon
     ]
@@ -273,7 +337,8 @@ def test_number_of_contacts():
             pair = (i, j) if i < j else (j, i)
             if pair not in exclusions:
                 pairs.add(pair)
-    distances = np.array([np.linalg.norm(pos[i] - pos[j]) for i, j in pairs])
+    atoms1, atoms2 = np.array(list(pairs)).T
+    distances = np.linalg.norm(pos[atoms1, :] - pos[atoms2, :], axis=1)
     contacts = np.where(distances <= 0.6, 1 / (1 + (distances / 0.3) ** 6), 0)
     number_of_contacts = cvpack.NumberOfContacts(
         group1,
@@ -282,10 +347,7 @@ def test_number_of_contacts():
         switchFactor=None,
     )
     number_of_contacts.addToSystem(model.system)
-    integrator = openmm.CustomIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     nc_value = number_of_contacts.getValue(context)
     assert nc_value / nc_value.unit == pytest.approx(contacts.sum())
     perform_common_tests(number_of_contacts, context)
@@ -293,9 +355,10 @@ def test_number_of_contacts():
 
 def run_rmsd_test(
     coordinates: np.ndarray,
+    reference: np.ndarray,
+    fullReference: t.Union[np.ndarray, t.List[openmm.Vec3]],
     group: t.Sequence[int],
     passGroupOnly: bool,
-    passVec3: bool,
 ) -> None:
     """
     Performs a specific RMSD test
@@ -303,12 +366,10 @@ def run_rmsd_test(
     """
     model = testsystems.AlanineDipeptideVacuum()
     num_atoms = model.topology.getNumAtoms()
-    reference = np.array(model.positions.value_in_unit(unit.nanometers))
-    group_ref = reference[group, :] - reference[group, :].mean(axis=0)
-    if passVec3:
-        reference = [openmm.Vec3(*row) for row in reference]
+    group_ref = reference[group]
+    group_ref = group_ref - group_ref.mean(axis=0)
     rmsd = cvpack.RMSD(
-        dict(zip(group, group_ref)) if passGroupOnly else reference,
+        dict(zip(group, group_ref)) if passGroupOnly else fullReference,
         group,
         num_atoms,
     )
@@ -317,10 +378,16 @@ def run_rmsd_test(
     platform = openmm.Platform.getPlatformByName("Reference")
     context = openmm.Context(model.system, integrator, platform)
     context.setPositions(coordinates)
-    group_coords = coordinates[group, :] - coordinates[group, :].mean(axis=0)
+    group_coords = coordinates[group]
+    group_coords = group_coords - group_coords.mean(axis=0)
     _, rssd = Rotation.align_vectors(group_coords, group_ref)
     rmsd_value = rmsd.getValue(context)
-    assert rmsd_value / rmsd_value.unit == pytest.approx(rssd / np.sqrt(len(group)))
+    assert math.isclose(
+        rmsd_value / rmsd_value.unit,
+        rssd / np.sqrt(len(group)),
+        rel_tol=1e-6,
+        abs_tol=1e-12,
+    )
 
 
 def test_rmsd():
@@ -342,17 +409,31 @@ def test_rmsd():
     state = context.getState(  # pylint: disable=unexpected-keyword-arg
         getPositions=True
     )
-    coordinates = state.getPositions(asNumpy=True).value_in_unit(unit.nanometers)
-    for pass_vec3 in [False, True]:
+    coordinates = np.asarray(
+        state.getPositions(asNumpy=True).value_in_unit(unit.nanometers)
+    )
+    reference = np.array(model.positions.value_in_unit(unit.nanometers))
+    reference_vec3 = [openmm.Vec3(*row) for row in reference]
+    for full_reference in [reference, reference_vec3]:
         for pass_group_only in [False, True]:
             group = np.arange(num_atoms)
-            run_rmsd_test(coordinates, group, pass_group_only, pass_vec3)
             run_rmsd_test(
-                coordinates, group[: num_atoms // 2], pass_group_only, pass_vec3
+                coordinates, reference, full_reference, group, pass_group_only
+            )
+            run_rmsd_test(
+                coordinates,
+                reference,
+                full_reference,
+                group[: num_atoms // 2],
+                pass_group_only,
             )
             np.random.shuffle(group)
             run_rmsd_test(
-                coordinates, group[: num_atoms // 2], pass_group_only, pass_vec3
+                coordinates,
+                reference,
+                full_reference,
+                group[: num_atoms // 2],
+                pass_group_only,
             )
     perform_common_tests(rmsd, context)
 
@@ -388,12 +469,12 @@ def test_composite_rmsd():
     perform_common_tests(crmsd2, context)
 
 
-def test_helix_torsion_content():
+def test_helix_torsion_content(lysozymeContext):
     """
     Test whether a helix ramachandran content is computed correctly.
 
     """
-    model = testsystems.LysozymeImplicit()
+    model, context = lysozymeContext
 
     positions = model.positions.value_in_unit(unit.nanometers)
     traj = mdtraj.Trajectory(positions, mdtraj.Topology.from_openmm(model.topology))
@@ -409,22 +490,19 @@ def test_helix_torsion_content():
     assert str(excinfo.value) == "Could not find atom N in residue TMP163"
     helix_content = cvpack.HelixTorsionContent(residues[0:-1])
     helix_content.addToSystem(model.system)
-    integrator = openmm.VerletIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     cv_value = helix_content.getValue(context)
 
     assert cv_value / cv_value.unit == pytest.approx(computed_value)
     perform_common_tests(helix_content, context)
 
 
-def test_helix_angle_content():
+def test_helix_angle_content(lysozymeContext):
     """
     Test whether a helix angle content is computed correctly.
 
     """
-    model = testsystems.LysozymeImplicit()
+    model, context = lysozymeContext
 
     positions = model.positions.value_in_unit(unit.nanometers)
     traj = mdtraj.Trajectory(positions, mdtraj.Topology.from_openmm(model.topology))
@@ -442,21 +520,18 @@ def test_helix_angle_content():
     assert str(excinfo.value) == "Could not find atom CA in residue TMP163"
     helix_content = cvpack.HelixAngleContent(residues[0:-1])
     helix_content.addToSystem(model.system)
-    integrator = openmm.VerletIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     cv_value = helix_content.getValue(context)
     assert cv_value / cv_value.unit == pytest.approx(computed_value)
     perform_common_tests(helix_content, context)
 
 
-def test_helix_hbond_content():
+def test_helix_hbond_content(lysozymeContext):
     """
     Test whether a helix hydrogen-bond content is computed correctly.
 
     """
-    model = testsystems.LysozymeImplicit()
+    model, context = lysozymeContext
 
     positions = model.positions.value_in_unit(unit.nanometers)
     traj = mdtraj.Trajectory(positions, mdtraj.Topology.from_openmm(model.topology))
@@ -473,22 +548,19 @@ def test_helix_hbond_content():
         helix_content = cvpack.HelixHBondContent(residues)
     helix_content = cvpack.HelixHBondContent(residues[58:79])
     helix_content.addToSystem(model.system)
-    integrator = openmm.VerletIntegrator(0)
-    platform = openmm.Platform.getPlatformByName("Reference")
-    context = openmm.Context(model.system, integrator, platform)
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     cv_value = helix_content.getValue(context)
     assert cv_value / cv_value.unit == pytest.approx(computed_value)
     perform_common_tests(helix_content, context)
 
 
 @pytest.mark.parametrize("normalize", [False, True])
-def test_helix_rmsd_content(normalize: bool):
+def test_helix_rmsd_content(normalize: bool, lysozymeContext):
     """
     Test whether a helix rmsd content is computed correctly.
 
     """
-    model = testsystems.LysozymeImplicit()
+    model, context = lysozymeContext
 
     num_atoms = model.topology.getNumAtoms()
     residues = list(model.topology.residues())
@@ -502,19 +574,19 @@ def test_helix_rmsd_content(normalize: bool):
     helix_content = cvpack.HelixRMSDContent(
         residues[start:end], num_atoms, normalize=normalize
     )
-    helix_content.addToSystem(model.system)
-    context = openmm.Context(
-        model.system,
-        openmm.VerletIntegrator(0),
-        openmm.Platform.getPlatformByName("Reference"),
+    other_step = cvpack.HelixRMSDContent(
+        residues[start:end], num_atoms, stepFunction="exp(-x^2)"
     )
-    context.setPositions(model.positions)
+    assert other_step.getEnergyFunction().startswith("exp(-x0^2)+exp(-x1^2)+")
+    helix_content.addToSystem(model.system)
+    context.reinitialize(preserveState=True)
     cv_value = helix_content.getValue(context)
 
     traj = mdtraj.Trajectory(
         model.positions, mdtraj.Topology.from_openmm(model.topology)
     )
     ref = copy.deepcopy(traj)
+    assert "ALPHA_POSITIONS" in dir(cvpack.helix_rmsd_content)
     positions = cvpack.helix_rmsd_content.ALPHA_POSITIONS
     # pylint: enable=protected-access
 
@@ -543,12 +615,12 @@ def test_helix_rmsd_content(normalize: bool):
     perform_common_tests(helix_content, context)
 
 
-def test_helix_torsion_similarity():
+def test_helix_torsion_similarity(lysozymeContext):
     """
     Test whether a torsion similarity CV is computed correctly.
 
     """
-    model = testsystems.LysozymeImplicit()
+    model, context = lysozymeContext
     positions = model.positions.value_in_unit(unit.nanometers)
     traj = mdtraj.Trajectory(positions, mdtraj.Topology.from_openmm(model.topology))
     phi_atoms, phi = mdtraj.compute_phi(traj)
@@ -558,18 +630,14 @@ def test_helix_torsion_similarity():
         np.vstack([phi_atoms[:-1], psi_atoms[:-1]]),
     )
     torsion_similarity.addToSystem(model.system)
-    context = openmm.Context(
-        model.system,
-        openmm.VerletIntegrator(0),
-        openmm.Platform.getPlatformByName("Reference"),
-    )
-    context.setPositions(model.positions)
+    context.reinitialize(preserveState=True)
     cv_value = torsion_similarity.getValue(context)
     phi = phi.ravel()
     psi = psi.ravel()
-    deltas = np.hstack([phi[1:], psi[1:]]) - np.hstack([phi[:-1], psi[:-1]])
-    deltas = np.array([min(delta, 2 * np.pi - delta) for delta in deltas])
-    assert cv_value / cv_value.unit == pytest.approx(np.sum(0.5 * (1 + np.cos(deltas))))
+    deltas = np.concatenate((phi[1:] - phi[:-1], psi[1:] - psi[:-1]))
+    deltas = np.minimum(deltas, 2 * np.pi - deltas)
+    computed_value = 0.5 * (deltas.size + np.cos(deltas).sum())
+    assert cv_value / cv_value.unit == pytest.approx(computed_value)
     perform_common_tests(torsion_similarity, context)
 
 
@@ -752,12 +820,12 @@ def test_attraction_strength():
 
 
 @pytest.mark.parametrize("includeHs", [False, True])
-def test_residue_coordination(includeHs: bool):
+def test_residue_coordination(includeHs: bool, lysozymeContext):
     """
     Test whether a residue coordination CV is computed correctly.
 
     """
-    model = testsystems.LysozymeImplicit()
+    model, context = lysozymeContext
     positions = model.positions.value_in_unit(unit.nanometers)
     groups = [
         list(it.islice(model.topology.residues(), start, end))
@@ -777,12 +845,7 @@ def test_residue_coordination(includeHs: bool):
         *groups, pbc=False, weighByMass=False, includeHydrogens=includeHs
     )
     res_coord.addToSystem(model.system)
-    context = openmm.Context(
-        model.system,
-        openmm.VerletIntegrator(0),
-        openmm.Platform.getPlatformByName("Reference"),
-    )
-    context.setPositions(positions)
+    context.reinitialize(preserveState=True)
     cv_value = res_coord.getValue(context)
 
     assert cv_value / cv_value.unit == pytest.approx(computed_cv)